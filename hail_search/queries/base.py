@@ -18,9 +18,14 @@ PredictionPath = namedtuple('PredictionPath', ['source', 'field', 'format'], def
 QualityFilterFormat = namedtuple('QualityFilterFormat', ['scale', 'override'], defaults=[None, None])
 
 
+CAMEL_CASE_MAP = {}
+
+
 def _to_camel_case(snake_case_str):
-    converted = snake_case_str.replace('_', ' ').title().replace(' ', '')
-    return converted[0].lower() + converted[1:]
+    if not CAMEL_CASE_MAP.get(snake_case_str):
+        converted = snake_case_str.replace('_', ' ').title().replace(' ', '')
+        CAMEL_CASE_MAP[snake_case_str] = converted[0].lower() + converted[1:]
+    return CAMEL_CASE_MAP[snake_case_str]
 
 
 class BaseHailTableQuery(object):
@@ -193,13 +198,14 @@ class BaseHailTableQuery(object):
 
         return value
 
-    def __init__(self, sample_data, genome_version, sort=XPOS, sort_metadata=None, num_results=100, inheritance_mode=None,
+    def __init__(self, sample_data, genome_version, sort=XPOS, sort_metadata=None, num_results=100, page=1, inheritance_mode=None,
                  override_comp_het_alt=False, **kwargs):
         self.unfiltered_comp_het_ht = None
         self._genome_version = genome_version
         self._sort = sort
         self._sort_metadata = sort_metadata
         self._num_results = num_results
+        self._page = page
         self._override_comp_het_alt = override_comp_het_alt
         self._ht = None
         self._comp_het_ht = None
@@ -264,18 +270,17 @@ class BaseHailTableQuery(object):
         return ht.annotate(**query_result)
 
     def import_filtered_table(self, sample_data, intervals=None, **kwargs):
-        family_samples = defaultdict(list)
-        project_samples = defaultdict(list)
-        for s in sample_data:
-            family_samples[s['family_guid']].append(s)
-            project_samples[s['project_guid']].append(s)
-
-        logger.info(f'Loading {self.DATA_TYPE} data for {len(family_samples)} families in {len(project_samples)} projects')
-        if len(family_samples) == 1:
-            family_guid, family_sample_data = list(family_samples.items())[0]
-            family_ht = self._read_table(f'families/{family_guid}.ht')
-            families_ht, _ = self._filter_entries_table(family_ht, family_sample_data, **kwargs)
+        family_guids = {s['family_guid'] for s in sample_data}
+        if len(family_guids) == 1:
+            logger.info(f'Loading {self.DATA_TYPE} data for 1 families in 1 projects')
+            family_ht = self._read_table(f'families/{next(iter(family_guids))}.ht')
+            families_ht, _ = self._filter_entries_table(family_ht, sample_data, **kwargs)
         else:
+            project_samples = defaultdict(list)
+            for s in sample_data:
+                project_samples[s['project_guid']].append(s)
+            logger.info(f'Loading {self.DATA_TYPE} data for {len(family_guids)} families in {len(project_samples)} projects')
+
             filtered_project_hts = []
             exception_messages = set()
             for project_guid, project_sample_data in project_samples.items():
@@ -348,7 +353,7 @@ class BaseHailTableQuery(object):
         sample_id_index_map = {v: k for k, v in sample_index_id_map.items()}
         sample_index_id_map = hl.dict(sample_index_id_map)
         sample_individual_map = {s['sample_id']: s['individual_guid'] for s in sample_data}
-        missing_samples = set(sample_individual_map.keys()) - set(sample_id_index_map.keys())
+        missing_samples = sample_individual_map.keys() - sample_id_index_map.keys()
         if missing_samples:
             raise HTTPBadRequest(
                 reason=f'The following samples are available in seqr but missing the loaded data: {", ".join(sorted(missing_samples))}'
@@ -424,7 +429,7 @@ class BaseHailTableQuery(object):
     def _filter_families_inheritance(self, ht, inheritance_mode, inheritance_filter, sample_id_family_index_map, sample_data, field):
         individual_genotype_filter = (inheritance_filter or {}).get('genotype')
 
-        entry_indices_by_gt = defaultdict(lambda: defaultdict(list))
+        entry_indices_by_gt = {}
         for s in sample_data:
             genotype = individual_genotype_filter.get(s['individual_guid']) \
                 if individual_genotype_filter else INHERITANCE_FILTERS[inheritance_mode].get(s['affected'])
@@ -434,7 +439,7 @@ class BaseHailTableQuery(object):
                 genotype = HAS_ALT
             if genotype:
                 family_index, entry_index = sample_id_family_index_map[s['sample_id']]
-                entry_indices_by_gt[genotype][family_index].append(entry_index)
+                entry_indices_by_gt.setdefault(genotype, {}).setdefault(family_index, []).append(entry_index)
 
         for genotype, entry_indices in entry_indices_by_gt.items():
             entry_indices = hl.dict(entry_indices)
@@ -809,8 +814,10 @@ class BaseHailTableQuery(object):
     def search(self):
         ht = self.format_search_ht()
 
-        (total_results, collected) = ht.aggregate((hl.agg.count(), hl.agg.take(ht.row, self._num_results, ordering=ht._sort)))
-        logger.info(f'Total hits: {total_results}. Fetched: {self._num_results}')
+        end_offset = self._num_results * self._page
+        (total_results, collected) = ht.aggregate((hl.agg.count(), hl.agg.take(ht.row, end_offset, ordering=ht._sort)))
+        collected = collected[end_offset - self._num_results:]
+        logger.info(f'Total hits: {total_results}. Fetched: {len(collected)}')
 
         return self._format_collected_rows(collected), total_results
 
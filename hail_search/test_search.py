@@ -1,5 +1,6 @@
 from aiohttp.test_utils import AioHTTPTestCase
 from copy import deepcopy
+import hail as hl
 
 from hail_search.test_utils import get_hail_search_body, FAMILY_2_VARIANT_SAMPLE_DATA, FAMILY_2_MISSING_SAMPLE_DATA, \
     VARIANT1, VARIANT2, VARIANT3, VARIANT4, MULTI_PROJECT_SAMPLE_DATA, MULTI_PROJECT_MISSING_SAMPLE_DATA, \
@@ -8,7 +9,7 @@ from hail_search.test_utils import get_hail_search_body, FAMILY_2_VARIANT_SAMPLE
     GCNV_MULTI_FAMILY_VARIANT1, GCNV_MULTI_FAMILY_VARIANT2, SV_WES_SAMPLE_DATA, EXPECTED_SAMPLE_DATA, \
     FAMILY_2_MITO_SAMPLE_DATA, FAMILY_2_ALL_SAMPLE_DATA, MITO_VARIANT1, MITO_VARIANT2, MITO_VARIANT3, \
     EXPECTED_SAMPLE_DATA_WITH_SEX, SV_WGS_SAMPLE_DATA_WITH_SEX
-from hail_search.web_app import init_web_app
+from hail_search.web_app import init_web_app, hl_json_dumps
 
 PROJECT_2_VARIANT = {
     'variantId': '1-10146-ACC-A',
@@ -139,6 +140,12 @@ class HailSearchTestCase(AioHTTPTestCase):
             resp_json = await resp.json()
         self.assertDictEqual(resp_json, {'success': True})
 
+    def test_hl_json_dumps(self):
+        self.assertEqual(
+            hl_json_dumps([hl.Struct(ab=float('nan'), scores=[float('inf'), 0.5], nested=hl.Struct(cadd=float('-inf')))]),
+            '[{"ab": null, "scores": [null, 0.5], "nested": {"cadd": null}}]',
+        )
+
     async def _assert_expected_search(self, results, gene_counts=None, **search_kwargs):
         search_body = get_hail_search_body(**search_kwargs)
         async with self.client.request('POST', '/search', json=search_body) as resp:
@@ -232,6 +239,13 @@ class HailSearchTestCase(AioHTTPTestCase):
             sample_data={**MULTI_PROJECT_SAMPLE_DATA, **SV_WGS_SAMPLE_DATA},
         )
 
+    async def test_paginated_search(self):
+        search_body = get_hail_search_body(sample_data=FAMILY_2_VARIANT_SAMPLE_DATA, num_results=2, page=2)
+        async with self.client.request('POST', '/search', json=search_body) as resp:
+            self.assertEqual(resp.status, 200)
+            resp_json = await resp.json()
+        self.assertDictEqual(resp_json, {'results': [VARIANT3, VARIANT4], 'total': 4})
+
     async def test_inheritance_filter(self):
         inheritance_mode = 'any_affected'
         await self._assert_expected_search(
@@ -2,6 +2,7 @@ from aiohttp import web
 import json
 import hail as hl
 import logging
+import math
 
 from hail_search.search import search_hail_backend, load_globals
 
@@ -23,9 +24,18 @@ async def error_middleware(request, handler):
         _handle_exception(web.HTTPInternalServerError(reason=str(e)), request)
 
 
+def _hl_json_value(value):
+    # Non-finite floats are not valid JSON, so encode them as null
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    elif isinstance(value, (list, tuple)):
+        return [_hl_json_value(v) for v in value]
+    return value
+
+
 def _hl_json_default(o):
     if isinstance(o, hl.Struct) or isinstance(o, hl.utils.frozendict):
-        return dict(o)
+        return {k: _hl_json_value(v) for k, v in o.items()}
     elif isinstance(o, set):
         return sorted(o)
 
@@ -36,7 +36,7 @@ def update_hpo(hpo_file_path=None):
         hpo_file_path = download_file(url=HP_OBO_URL)
 
     with open(hpo_file_path) as f:
-        print("Parsing {}".format(HP_OBO_URL))
+        logger.info('Parsing {}'.format(hpo_file_path))
         hpo_id_to_record = parse_obo_file(f)
 
     # for each hpo id, find its top level category
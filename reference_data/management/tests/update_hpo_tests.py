@@ -152,6 +152,7 @@ class UpdateHpoTest(TestCase):
         call_command('update_human_phenotype_ontology')
 
         calls = [
+            mock.call('Parsing {}'.format(tmp_file)),
             mock.call('Deleting HumanPhenotypeOntology table with 11 records and creating new table with 5 records'),
             mock.call('Done'),
         ]
@@ -163,6 +164,7 @@ class UpdateHpoTest(TestCase):
         call_command('update_human_phenotype_ontology', tmp_file)
 
         calls = [
+            mock.call('Parsing {}'.format(tmp_file)),
             mock.call('Deleting HumanPhenotypeOntology table with 5 records and creating new table with 5 records'),
             mock.call('Done'),
         ]
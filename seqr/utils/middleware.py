@@ -127,26 +127,28 @@ class LogRequestMiddleware(MiddlewareMixin):
         log_error = False
         traceback = None
         detail = None
-        try:
+        # Only error responses carry logging details, so avoid re-parsing successful response content
+        if response.status_code >= 400:
             try:
-                response_json = json.loads(response.content)
-                is_json = True
-            except ValueError:
-                response_json = response.data
-                is_json = False
-
-            error = response_json.get('error')
-            if response_json.get('errors'):
-                error = '; '.join(response_json['errors'])
-            traceback = response_json.pop('traceback', None)
-            detail = response_json.get('detail')
-            log_error = response_json.get('log_error')
-            if is_json:
-                response.content = json.dumps(response_json)
-            else:
-                response.data = response_json
-        except (ValueError, AttributeError):
-            pass
+                try:
+                    response_json = json.loads(response.content)
+                    is_json = True
+                except ValueError:
+                    response_json = response.data
+                    is_json = False
+
+                error = response_json.get('error')
+                if response_json.get('errors'):
+                    error = '; '.join(response_json['errors'])
+                traceback = response_json.pop('traceback', None)
+                detail = response_json.get('detail')
+                log_error = response_json.get('log_error')
+                if is_json:
+                    response.content = json.dumps(response_json)
+                else:
+                    response.data = response_json
+            except (ValueError, AttributeError):
+                pass
 
         message = ''
         if log_error or (response.status_code >= 500 and response.status_code != 504):
@@ -277,7 +277,7 @@ class EsSearch(object):
             exclude_locations = locus and locus.get('excludeLocations')
             self._filter(_location_filter(genes, intervals, exclude_locations))
             if genes and not exclude_locations:
-                self._filtered_gene_ids = set(genes.keys())
+                self._filtered_gene_ids = genes.keys()
         elif variant_ids:
             self.filter_by_variant_ids(variant_ids)
         elif rs_ids:
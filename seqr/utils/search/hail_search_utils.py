@@ -1,7 +1,10 @@
-from collections import defaultdict
-from django.db.models import F, Min
+from cachetools import cached, TTLCache
+from django.db.models import Case, F, Min, Value, When
+from django.db.models.functions import Concat
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from reference_data.models import Omim, GeneConstraint, GENOME_VERSION_LOOKUP
 from seqr.models import Sample, PhenotypePrioritization
 from seqr.utils.search.constants import PRIORITIZED_GENE_SORT, X_LINKED_RECESSIVE
@@ -9,27 +12,50 @@ from seqr.utils.xpos_utils import MIN_POS, MAX_POS
 from settings import HAIL_BACKEND_SERVICE_HOSTNAME, HAIL_BACKEND_SERVICE_PORT
 
 
+REFERENCE_DATA_CACHE_TTL = 60 * 60
+MAX_GENE_INTERVALS = 100
+
+SAMPLE_DATA_TYPE_KEY = Case(
+    When(dataset_type=Sample.DATASET_TYPE_SV_CALLS, then=Concat('dataset_type', Value('_'), 'sample_type')),
+    default=F('dataset_type'),
+)
+
+# Reuse connections to the hail backend across searches
+HAIL_BACKEND_SESSION = requests.Session()
+HAIL_BACKEND_SESSION.mount('http://', HTTPAdapter(pool_connections=8, pool_maxsize=32))
+
+
 def _hail_backend_url(path):
     return f'{HAIL_BACKEND_SERVICE_HOSTNAME}:{HAIL_BACKEND_SERVICE_PORT}/{path}'
 
 
 def _execute_search(search_body, user, path='search'):
-    response = requests.post(_hail_backend_url(path), json=search_body, headers={'From': user.email}, timeout=300)
+    response = HAIL_BACKEND_SESSION.post(
+        _hail_backend_url(path), data=orjson.dumps(search_body),
+        headers={'From': user.email, 'Content-Type': 'application/json'}, timeout=300,
+    )
 
     if response.status_code >= 400:
         raise requests.HTTPError(response.text or response.reason, response=response)
 
-    return response.json()
+    return orjson.loads(response.content)
 
 
 def ping_hail_backend():
-    requests.get(_hail_backend_url('status'), timeout=5).raise_for_status()
+    HAIL_BACKEND_SESSION.get(_hail_backend_url('status'), timeout=5).raise_for_status()
 
 
 def get_hail_variants(samples, search, user, previous_search_results, genome_version, sort=None, page=1, num_results=100,
                       gene_agg=False, **kwargs):
     end_offset = num_results * page
-    search_body = _format_search_body(samples, genome_version, end_offset, search)
+    loaded_results = previous_search_results.get('all_results') or []
+    # If all prior pages are already cached, only fetch the requested page from the backend
+    fetch_page_only = page > 1 and not gene_agg and len(loaded_results) == end_offset - num_results
+    search_body = _format_search_body(
+        samples, genome_version, num_results if fetch_page_only else end_offset, search,
+    )
+    if fetch_page_only:
+        search_body['page'] = page
 
     frequencies = search_body.pop('freqs', None)
     if frequencies and frequencies.get('callset'):
@@ -54,6 +80,10 @@ def get_hail_variants(samples, search, user, previous_search_results, genome_ver
         return response_json
 
     previous_search_results['total_results'] = response_json['total']
+    if fetch_page_only:
+        previous_search_results['all_results'] = loaded_results + response_json['results']
+        return response_json['results']
+
     previous_search_results['all_results'] = response_json['results']
     return response_json['results'][end_offset - num_results:end_offset]
 
@@ -67,7 +97,9 @@ def get_hail_variants_for_variant_ids(samples, genome_version, parsed_variant_id
     response_json = _execute_search(search_body, user)
 
     if return_all_queried_families:
-        expected_family_guids = set(samples.values_list('individual__family__guid', flat=True))
+        expected_family_guids = {
+            s['family_guid'] for data_type_samples in search_body['sample_data'].values() for s in data_type_samples
+        }
         _validate_expected_families(response_json['results'], expected_family_guids)
 
     return response_json['results']
@@ -84,6 +116,7 @@ def _format_search_body(samples, genome_version, num_results, search):
 
 
 def _get_sample_data(samples, inheritance_filter=None, inheritance_mode=None, **kwargs):
+    # Sample data is sent to the hail backend as-is, so any values added here must be JSON primitives
     sample_values = dict(
         individual_guid=F('individual__guid'),
         family_guid=F('individual__family__guid'),
@@ -92,19 +125,15 @@ def _get_sample_data(samples, inheritance_filter=None, inheritance_mode=None, **
     )
     if inheritance_mode == X_LINKED_RECESSIVE:
         sample_values['sex'] = F('individual__sex')
-    sample_data = samples.order_by('id').values('sample_id', 'dataset_type', 'sample_type', **sample_values)
+    sample_data = samples.order_by('id').values('sample_id', data_type_key=SAMPLE_DATA_TYPE_KEY, **sample_values)
 
     custom_affected = (inheritance_filter or {}).pop('affected', None)
-    if custom_affected:
-        for s in sample_data:
-            s['affected'] = custom_affected.get(s['individual_guid']) or s['affected']
 
-    sample_data_by_data_type = defaultdict(list)
+    sample_data_by_data_type = {}
     for s in sample_data:
-        dataset_type = s.pop('dataset_type')
-        sample_type = s.pop('sample_type')
-        data_type_key = f'{dataset_type}_{sample_type}' if dataset_type == Sample.DATASET_TYPE_SV_CALLS else dataset_type
-        sample_data_by_data_type[data_type_key].append(s)
+        if custom_affected:
+            s['affected'] = custom_affected.get(s['individual_guid']) or s['affected']
+        sample_data_by_data_type.setdefault(s.pop('data_type_key'), []).append(s)
 
     return sample_data_by_data_type
 
@@ -112,37 +141,59 @@ def _get_sample_data(samples, inheritance_filter=None, inheritance_mode=None, **
 def _get_sort_metadata(sort, samples):
     sort_metadata = None
     if sort == 'in_omim':
-        sort_metadata = list(Omim.objects.filter(phenotype_mim_number__isnull=False).values_list('gene__gene_id', flat=True))
+        sort_metadata = _get_omim_gene_ids()
     elif sort == 'constraint':
-        sort_metadata = {
-            agg['gene__gene_id']: agg['mis_z_rank'] + agg['pLI_rank'] for agg in
-            GeneConstraint.objects.values('gene__gene_id', 'mis_z_rank', 'pLI_rank')
-        }
+        sort_metadata = _get_constraint_gene_ranks()
     elif sort == PRIORITIZED_GENE_SORT:
-        sort_metadata = {
-            agg['gene_id']: agg['min_rank'] for agg in PhenotypePrioritization.objects.filter(
-                individual__family_id=samples[0].individual.family_id, rank__lte=100,
-            ).values('gene_id').annotate(min_rank=Min('rank'))
-        }
+        sort_metadata = dict(PhenotypePrioritization.objects.filter(
+            individual__family_id=samples[0].individual.family_id, rank__lte=100,
+        ).values('gene_id').annotate(min_rank=Min('rank')).values_list('gene_id', 'min_rank'))
     return sort_metadata
 
 
+# Reference data rarely changes, so cache the sort metadata derived from it in process. Reference data is reloaded
+# by management commands in a separate process, so the cache TTL is the bound on how stale this metadata can be
+@cached(cache=TTLCache(maxsize=1, ttl=REFERENCE_DATA_CACHE_TTL))
+def _get_omim_gene_ids():
+    return list(Omim.objects.filter(phenotype_mim_number__isnull=False).values_list('gene__gene_id', flat=True))
+
+
+@cached(cache=TTLCache(maxsize=1, ttl=REFERENCE_DATA_CACHE_TTL))
+def _get_constraint_gene_ranks():
+    return dict(GeneConstraint.objects.annotate(
+        rank_sum=F('mis_z_rank') + F('pLI_rank'),
+    ).values_list('gene__gene_id', 'rank_sum'))
+
+
 def _parse_location_search(search):
     locus = search.pop('locus', None) or {}
     parsed_locus = search.pop('parsedLocus')
 
     genes = parsed_locus.get('genes') or {}
     intervals = parsed_locus.get('intervals')
+    exclude_locations = locus.get('excludeLocations')
     parsed_intervals = None
     if genes or intervals:
-        gene_coords = [
-            {field: gene[f'{field}{search["genome_version"].title()}'] for field in ['chrom', 'start', 'end']}
-            for gene in genes.values()
+        genome_version = search['genome_version'].title()
+        coord_fields = [f'{field}{genome_version}' for field in ['chrom', 'start', 'end']]
+        chrom_field, start_field, end_field = coord_fields
+        missing_coord_genes = [
+            gene_id for gene_id, gene in genes.items() if any(gene.get(field) is None for field in coord_fields)
         ]
+        if missing_coord_genes:
+            from seqr.utils.search.utils import InvalidSearchException
+            raise InvalidSearchException(
+                f'Unable to search against genes with no {search["genome_version"]} coordinates: {", ".join(sorted(missing_coord_genes))}')
+        gene_coords = sorted((gene[chrom_field], gene[start_field], gene[end_field]) for gene in genes.values())
+        # Large gene lists search a single span per chromosome and rely on the gene_ids filter. This also returns
+        # variants annotated to a gene but outside its bounds (i.e. upstream/downstream variants or SVs), which are
+        # excluded when searching smaller gene lists by exact gene intervals
+        if len(gene_coords) > MAX_GENE_INTERVALS and not exclude_locations:
+            gene_intervals = _get_chromosome_spans(gene_coords)
+        else:
+            gene_intervals = _merge_overlapping_intervals(gene_coords)
         parsed_intervals = [_format_interval(**interval) for interval in intervals or []] + [
-            '{chrom}:{start}-{end}'.format(**gene) for gene in gene_coords]
-
-    exclude_locations = locus.get('excludeLocations')
+            f'{chrom}:{start}-{end}' for chrom, start, end in gene_intervals]
 
     search.update({
         'intervals': parsed_intervals,
@@ -153,6 +204,26 @@ def _parse_location_search(search):
     })
 
 
+def _merge_overlapping_intervals(sorted_coords):
+    merged = []
+    for chrom, start, end in sorted_coords:
+        if merged and merged[-1][0] == chrom and start <= merged[-1][2]:
+            merged[-1][2] = max(merged[-1][2], end)
+        else:
+            merged.append([chrom, start, end])
+    return merged
+
+
+def _get_chromosome_spans(sorted_coords):
+    spans = {}
+    for chrom, start, end in sorted_coords:
+        if chrom in spans:
+            spans[chrom][2] = max(spans[chrom][2], end)
+        else:
+            spans[chrom] = [chrom, start, end]
+    return spans.values()
+
+
 def _format_interval(chrom=None, start=None, end=None, offset=None, **kwargs):
     if offset:
         offset_pos = int((end - start) * offset)
@@ -2,10 +2,14 @@ from copy import deepcopy
 from django.test import TestCase
 import json
 import mock
+import orjson
 from requests import HTTPError
 import responses
 
-from seqr.models import Family
+from reference_data.models import Omim
+from seqr.models import Family, Sample
+from seqr.utils.search.hail_search_utils import _get_omim_gene_ids, _get_constraint_gene_ranks, _get_sample_data, \
+    _parse_location_search
 from seqr.utils.search.utils import get_variant_query_gene_counts, query_variants, get_single_variant, \
     get_variants_for_variant_ids, InvalidSearchException
 from seqr.utils.search.search_utils_tests import SearchTestHelper
@@ -23,6 +27,8 @@ class HailSearchUtilsTests(SearchTestHelper, TestCase):
 
     def setUp(self):
         super(HailSearchUtilsTests, self).set_up()
+        _get_omim_gene_ids.cache_clear()
+        _get_constraint_gene_ranks.cache_clear()
         responses.add(responses.POST, f'{MOCK_HOST}:5000/search', status=200, json={
             'results': HAIL_BACKEND_VARIANTS, 'total': 5,
         })
@@ -59,6 +65,16 @@ class HailSearchUtilsTests(SearchTestHelper, TestCase):
 
         self._test_minimal_search_call(**expected_search, **kwargs)
 
+    def test_parse_location_search_missing_coordinates(self):
+        genes = {
+            'ENSG00000223972': {'chromGrch38': '1', 'startGrch38': 11869, 'endGrch38': 14409},
+            'ENSG00000237683': {'chromGrch38': None, 'startGrch38': None, 'endGrch38': None},
+        }
+        with self.assertRaises(InvalidSearchException) as cm:
+            _parse_location_search({'genome_version': 'GRCh38', 'parsedLocus': {'genes': genes}})
+        self.assertEqual(
+            str(cm.exception), 'Unable to search against genes with no GRCh38 coordinates: ENSG00000237683')
+
     @responses.activate
     def test_query_variants(self):
         variants, total = query_variants(self.results_model, user=self.user)
@@ -73,6 +89,17 @@ class HailSearchUtilsTests(SearchTestHelper, TestCase):
         self.assertListEqual(variants, HAIL_BACKEND_VARIANTS[1:])
         self._test_expected_search_call(sort='cadd', num_results=2)
 
+        self.set_cache({'all_results': HAIL_BACKEND_VARIANTS[:1], 'total_results': 5})
+        responses.replace(responses.POST, f'{MOCK_HOST}:5000/search', status=200, json={
+            'results': HAIL_BACKEND_VARIANTS[1:], 'total': 5,
+        })
+        variants, _ = query_variants(self.results_model, user=self.user, page=2, num_results=1)
+        self.assertListEqual(variants, HAIL_BACKEND_VARIANTS[1:])
+        self.assert_cached_results({'all_results': HAIL_BACKEND_VARIANTS, 'total_results': 5})
+        self._test_expected_search_call(num_results=1, page=2)
+
+        self.mock_redis.get.return_value = None
+
         self.search_model.search['locus'] = {'rawVariantItems': '1-10439-AC-A,1-91511686-TCA-G'}
         query_variants(self.results_model, user=self.user, sort='in_omim')
         self._test_expected_search_call(
@@ -81,6 +108,23 @@ class HailSearchUtilsTests(SearchTestHelper, TestCase):
             **VARIANT_ID_SEARCH,
         )
 
+        # Sort metadata is cached until it expires, even if the underlying reference data changes
+        Omim.objects.filter(gene__gene_id='ENSG00000268020').delete()
+        query_variants(self.results_model, user=self.user, sort='in_omim')
+        self._test_expected_search_call(
+            num_results=2,  dataset_type='SNV_INDEL', omit_sample_type='SV_WES',
+            sort='in_omim', sort_metadata=['ENSG00000223972', 'ENSG00000243485', 'ENSG00000268020'],
+            **VARIANT_ID_SEARCH,
+        )
+
+        _get_omim_gene_ids.cache_clear()
+        query_variants(self.results_model, user=self.user, sort='in_omim')
+        self._test_expected_search_call(
+            num_results=2,  dataset_type='SNV_INDEL', omit_sample_type='SV_WES',
+            sort='in_omim', sort_metadata=['ENSG00000223972', 'ENSG00000243485'],
+            **VARIANT_ID_SEARCH,
+        )
+
         self.search_model.search['locus']['rawVariantItems'] = 'rs1801131'
         query_variants(self.results_model, user=self.user, sort='constraint')
         self._test_expected_search_call(
@@ -95,6 +139,19 @@ class HailSearchUtilsTests(SearchTestHelper, TestCase):
         query_variants(self.results_model, user=self.user)
         self._test_expected_search_call(**EXCLUDE_LOCATION_SEARCH)
 
+        self.search_model.search['locus'] = {'rawItems': 'ENSG00000223972, ENSG00000227232'}
+        query_variants(self.results_model, user=self.user)
+        self._test_expected_search_call(
+            gene_ids=['ENSG00000223972', 'ENSG00000227232'], intervals=['1:11869-29570'],
+        )
+
+        self.search_model.search['locus'] = {'rawItems': 'ENSG00000223972, ENSG00000186092, ENSG00000177000'}
+        with mock.patch('seqr.utils.search.hail_search_utils.MAX_GENE_INTERVALS', 2):
+            query_variants(self.results_model, user=self.user)
+        self._test_expected_search_call(
+            gene_ids=['ENSG00000223972', 'ENSG00000186092', 'ENSG00000177000'], intervals=['1:11869-11806455'],
+        )
+
         self.search_model.search = {
             'inheritance': {'mode': 'recessive', 'filter': {'affected': {
                 'I000004_hg00731': 'N', 'I000005_hg00732': 'A', 'I000006_hg00733': 'U',
@@ -220,3 +277,10 @@ class HailSearchUtilsTests(SearchTestHelper, TestCase):
             variant_ids=[['2', 103343353, 'GAGA', 'G'], ['1', 248367227, 'TC', 'T']],
             variant_keys=[],
             num_results=2, sample_data={'SNV_INDEL': ALL_AFFECTED_SAMPLE_DATA['SNV_INDEL']})
+
+    def test_get_sample_data(self):
+        samples = Sample.objects.filter(individual__family__in=self.families, is_active=True)
+        sample_data = _get_sample_data(samples, inheritance_mode='x_linked_recessive')
+        self.assertSetEqual(set(sample_data.keys()), {'SNV_INDEL', 'MITO', 'SV_WES'})
+        # Ensure sample data serializes without a custom encoder and round-trips unchanged
+        self.assertDictEqual(orjson.loads(orjson.dumps(sample_data)), sample_data)
@@ -1,6 +1,8 @@
 from collections import defaultdict
 from copy import deepcopy
 from datetime import timedelta
+from functools import lru_cache
+from django.contrib.postgres.aggregates import ArrayAgg
 
 from seqr.models import Sample, Individual, Project
 from seqr.utils.redis_utils import safe_redis_get_json, safe_redis_set_json
@@ -80,23 +82,26 @@ def get_search_samples(projects, active_only=True):
 
 def _get_families_search_data(families, dataset_type=None):
     samples = _get_filtered_search_samples({'individual__family__in': families})
-    if len(samples) < 1:
+    if not samples.exists():
         raise InvalidSearchException('No search data found for families {}'.format(
             ', '.join([f.family_id for f in families])))
 
     if dataset_type:
         samples = samples.filter(dataset_type__in=DATASET_TYPES_LOOKUP[dataset_type])
-        if not samples:
+        if not samples.exists():
             raise InvalidSearchException(f'Unable to search against dataset type "{dataset_type}"')
 
-    projects = Project.objects.filter(family__individual__sample__in=samples).values_list('genome_version', 'name')
-    project_versions = defaultdict(set)
-    for genome_version, project_name in projects:
-        project_versions[genome_version].add(project_name)
+    project_ids = {f.project_id for f in families}
+    if len(project_ids) == 1:
+        return samples, Project.objects.filter(id__in=project_ids).values_list('genome_version', flat=True)[0]
+
+    project_versions = dict(Project.objects.filter(family__individual__sample__in=samples).values(
+        'genome_version').annotate(names=ArrayAgg('name', distinct=True, ordering='name')).values_list(
+        'genome_version', 'names'))
 
     if len(project_versions) > 1:
         summary = '; '.join(
-            [f"{build} - {', '.join(sorted(projects))}" for build, projects in sorted(project_versions.items())])
+            [f"{build} - {', '.join(projects)}" for build, projects in sorted(project_versions.items())])
         raise InvalidSearchException(
             f'Searching across multiple genome builds is not supported. Remove projects with differing genome builds from search: {summary}')
 
@@ -128,23 +133,23 @@ def get_variants_for_variant_ids(families, variant_ids, dataset_type=None, user=
 
 
 def _get_variants_for_variant_ids(families, variant_ids, user, dataset_type=None, **kwargs):
+    is_variant_dataset_type = dataset_type == Sample.DATASET_TYPE_VARIANT_CALLS
     parsed_variant_ids = {}
     for variant_id in variant_ids:
         try:
-            parsed_variant_ids[variant_id] = _parse_variant_id(variant_id)
+            parsed_variant_id = _parse_variant_id(variant_id)
         except (KeyError, ValueError):
-            parsed_variant_ids[variant_id] = None
-
-    if dataset_type:
-        parsed_variant_ids = {
-            k: v for k, v in parsed_variant_ids.items()
-            if (dataset_type == Sample.DATASET_TYPE_VARIANT_CALLS and v) or
-               (dataset_type != Sample.DATASET_TYPE_VARIANT_CALLS and not v)
-        }
-    elif all(v for v in parsed_variant_ids.values()):
-        dataset_type = Sample.DATASET_TYPE_VARIANT_CALLS
-    elif all(v is None for v in parsed_variant_ids.values()):
-        dataset_type = Sample.DATASET_TYPE_SV_CALLS
+            parsed_variant_id = None
+        # Only variant calls have parseable IDs, so skip IDs that do not match the requested dataset type
+        if dataset_type and bool(parsed_variant_id) != is_variant_dataset_type:
+            continue
+        parsed_variant_ids[variant_id] = parsed_variant_id
+
+    if not dataset_type:
+        if all(v for v in parsed_variant_ids.values()):
+            dataset_type = Sample.DATASET_TYPE_VARIANT_CALLS
+        elif all(v is None for v in parsed_variant_ids.values()):
+            dataset_type = Sample.DATASET_TYPE_SV_CALLS
 
     if dataset_type == Sample.DATASET_TYPE_VARIANT_CALLS:
         dataset_type = _variant_ids_dataset_type(parsed_variant_ids.values())
@@ -310,6 +315,7 @@ def _parse_variant_items(search_json):
     return rs_ids, variant_ids, parsed_variant_ids, invalid_items
 
 
+@lru_cache(maxsize=100000)
 def _parse_variant_id(variant_id):
     chrom, pos, ref, alt = variant_id.split('-')
     pos = int(pos)
@@ -344,12 +350,18 @@ def _annotation_dataset_type(annotations):
     if not annotations:
         return None
 
-    annotation_types = {k for k, v in annotations.items() if v}
-    if annotation_types.issubset(SV_ANNOTATION_TYPES):
-        return Sample.DATASET_TYPE_SV_CALLS
-    elif annotation_types.isdisjoint(SV_ANNOTATION_TYPES):
-        return Sample.DATASET_TYPE_VARIANT_CALLS
-    return ALL_DATA_TYPES
+    has_sv = has_non_sv = False
+    for annotation_type, value in annotations.items():
+        if not value:
+            continue
+        if annotation_type in SV_ANNOTATION_TYPES:
+            has_sv = True
+        else:
+            has_non_sv = True
+        if has_sv and has_non_sv:
+            return ALL_DATA_TYPES
+
+    return Sample.DATASET_TYPE_VARIANT_CALLS if has_non_sv else Sample.DATASET_TYPE_SV_CALLS
 
 
 def _parse_inheritance(search, samples, previous_search_results):
@@ -379,8 +391,8 @@ def _parse_inheritance(search, samples, previous_search_results):
             raise InvalidSearchException('Annotations must be specified to search for compound heterozygous variants')
 
         has_location_filter = bool(search['parsedLocus']['genes'] or search['parsedLocus']['intervals'])
-        family_ids = {s.individual.family_id for s in samples.select_related('individual')}
-        if not has_location_filter and len(family_ids) > MAX_NO_LOCATION_COMP_HET_FAMILIES:
+        num_families = samples.values('individual__family_id').distinct().count()
+        if not has_location_filter and num_families > MAX_NO_LOCATION_COMP_HET_FAMILIES:
             raise InvalidSearchException(
                 'Location must be specified to search for compound heterozygous variants across many families')
 
@@ -402,6 +414,9 @@ def _filter_inheritance_family_samples(samples, inheritance_filter):
     sample_group_field = backend_specific_call('elasticsearch_index', 'dataset_type')
     individual_affected_status = inheritance_filter.get('affected') or {}
     genotype_filter = None if inheritance_filter.get(Individual.AFFECTED_STATUS_AFFECTED) else inheritance_filter.get('genotype')
+    samples = samples.select_related('individual').only(
+        sample_group_field, 'individual__guid', 'individual__affected', 'individual__family',
+    )
     for sample in samples:
         if genotype_filter:
             is_filtered_family = sample.individual.guid in genotype_filter
@@ -1,5 +1,8 @@
+import hashlib
 import logging
+from threading import Lock
 
+from cachetools import TTLCache
 from django.shortcuts import redirect
 from urllib.parse import urlencode
 
@@ -7,9 +10,18 @@ from seqr.views.utils.terra_api_utils import anvil_call, TerraNotFoundException
 
 logger = logging.getLogger(__name__)
 
+# Recently validated registrations, keyed by a hash of the access token so the token itself is never stored
+ANVIL_REGISTRATION_CACHE = TTLCache(maxsize=4096, ttl=60)
+ANVIL_REGISTRATION_CACHE_LOCK = Lock()
+
 
 def validate_anvil_registration(backend, response, *args, **kwargs):
     if backend.name == 'google-oauth2':
+        token_key = hashlib.blake2b(response['access_token'].encode(), digest_size=16).digest()
+        with ANVIL_REGISTRATION_CACHE_LOCK:
+            if token_key in ANVIL_REGISTRATION_CACHE:
+                return None
+
         try:
             anvil_call('get', 'register', response['access_token'])
         except TerraNotFoundException as et:
@@ -17,6 +29,9 @@ def validate_anvil_registration(backend, response, *args, **kwargs):
                            extra={'user_email': response['email']})
             return _redirect_login_error('anvil_registration', backend)
 
+        with ANVIL_REGISTRATION_CACHE_LOCK:
+            ANVIL_REGISTRATION_CACHE[token_key] = True
+
 
 def validate_user_exist(backend, response, user=None, *args, **kwargs):
     if not user:
@@ -26,11 +41,11 @@ def validate_user_exist(backend, response, user=None, *args, **kwargs):
 
 
 def _redirect_login_error(error, backend):
-    params = ''
+    url = f'/login/error/{error}'
     next_param = backend.strategy.session_get('next')
     if next_param:
-        params = '?{}'.format(urlencode({'next': next_param}))
-    return redirect('/login/error/{}{}'.format(error, params))
+        url += '?' + urlencode({'next': next_param})
+    return redirect(url)
 
 
 def log_signed_in(backend, response, is_new=False, *args, **kwargs):
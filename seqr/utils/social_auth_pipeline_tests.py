@@ -3,7 +3,7 @@ import responses
 from unittest import TestCase
 
 from social_core.backends.google import GoogleOAuth2
-from seqr.utils.social_auth_pipeline import validate_anvil_registration, validate_user_exist, log_signed_in
+from seqr.utils.social_auth_pipeline import ANVIL_REGISTRATION_CACHE, validate_anvil_registration, validate_user_exist, log_signed_in
 from seqr.views.utils.test_utils import TEST_TERRA_API_ROOT_URL, REGISTER_RESPONSE
 
 
@@ -13,6 +13,7 @@ class SocialAuthPipelineTest(TestCase):
     @responses.activate
     @mock.patch('seqr.utils.social_auth_pipeline.logger')
     def test_validate_anvil_registration(self, mock_logger):
+        ANVIL_REGISTRATION_CACHE.clear()
         url = TEST_TERRA_API_ROOT_URL + 'register'
         responses.add(responses.GET, url, status=404)
         r = validate_anvil_registration(GoogleOAuth2(), {'access_token': '', 'email': 'test@seqr.org'})
@@ -33,6 +34,12 @@ class SocialAuthPipelineTest(TestCase):
         r = validate_anvil_registration(GoogleOAuth2(), {'access_token': '', 'email': 'test@seqr.org'})
         mock_logger.warning.assert_not_called()
         self.assertIsNone(r)
+        self.assertEqual(len(responses.calls), 3)
+
+        # Registration for a recently validated token is not re-checked
+        r = validate_anvil_registration(GoogleOAuth2(), {'access_token': '', 'email': 'test@seqr.org'})
+        self.assertIsNone(r)
+        self.assertEqual(len(responses.calls), 3)
 
     @mock.patch('seqr.utils.social_auth_pipeline.logger')
     def test_validate_user_exist(self, mock_logger):
@@ -33,20 +33,20 @@ def _update_case_review(model, project, request, field):
         raise PermissionDenied('User cannot edit case review for this project')
 
     update_json = {field: json.loads(request.body).get(field)}
-    update_model_from_json(model, update_json, user=request.user)
+    update_model_from_json(model, update_json, user=request.user, save_updated_fields_only=True)
 
     return create_json_response({
         model.guid: _get_json_for_model(model, user=request.user, additional_model_fields=[_to_snake_case(field)])
     })
 
 def _update_family_case_review(family_guid, request, field):
-    family = Family.objects.get(guid=family_guid)
+    family = Family.objects.select_related('project').get(guid=family_guid)
     project = family.project
 
     return _update_case_review(family, project, request, field)
 
 def _update_individual_case_review(individual_guid, request, field):
-    individual = Individual.objects.get(guid=individual_guid)
+    individual = Individual.objects.select_related('family__project').get(guid=individual_guid)
     project = individual.family.project
 
     return _update_case_review(individual, project, request, field)
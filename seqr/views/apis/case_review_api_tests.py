@@ -7,6 +7,7 @@ from django.urls.base import reverse
 
 from seqr.views.apis.case_review_api import save_internal_case_review_notes, save_internal_case_review_summary, \
     update_case_review_status, update_case_review_discussion
+from seqr.models import Individual
 from seqr.views.utils.test_utils import AuthenticationTestCase
 
 PROJECT_GUID = 'R0001_1kg'
@@ -62,6 +63,10 @@ class CaseReviewAPITest(AuthenticationTestCase):
                          '2020-01-01T00:00:00')
         self.assertEqual(response_json[INDIVIDUAL_GUID]['caseReviewStatusLastModifiedBy'], 'Test Manager User')
 
+        individual = Individual.objects.get(guid=INDIVIDUAL_GUID)
+        self.assertEqual(individual.case_review_status, 'A')
+        self.assertEqual(individual.case_review_status_last_modified_by.get_full_name(), 'Test Manager User')
+
         # send request for invalid project
         url = reverse(update_case_review_status, args=[NO_CASE_REVIEW_INDIVIDUAL_GUID])
         response = self.client.post(url, content_type='application/json', data=json.dumps({'caseReviewStatus': 'A'}))
@@ -140,9 +140,8 @@ def edit_families_handler(request, project_guid):
             fields[FAMILY_ID_FIELD]: family_models[fields['familyGuid']].family_id for fields in modified_families
             if fields.get('familyGuid') and fields.get(FAMILY_ID_FIELD) and \
                 fields[FAMILY_ID_FIELD] != family_models[fields['familyGuid']].family_id}
-        existing_families = {
-            f.family_id for f in Family.objects.filter(project=project, family_id__in=updated_family_ids.keys())
-        }
+        existing_families = set(Family.objects.filter(
+            project=project, family_id__in=updated_family_ids.keys()).values_list('family_id', flat=True))
         if existing_families:
             return create_json_response({
                 'error': 'Cannot update the following family ID(s) as they are already in use: {}'.format(', '.join([
@@ -203,8 +202,8 @@ def delete_families_handler(request, project_guid):
     family_guids_to_delete = [f['familyGuid'] for f in families_to_delete]
 
     # delete individuals 1st
-    individual_guids_to_delete = [i.guid for i in Individual.objects.filter(
-        family__project=project, family__guid__in=family_guids_to_delete)]
+    individual_guids_to_delete = list(Individual.objects.filter(
+        family__project=project, family__guid__in=family_guids_to_delete).values_list('guid', flat=True))
     delete_individuals(project, individual_guids_to_delete, request.user)
 
     # delete families
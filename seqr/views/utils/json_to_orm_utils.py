@@ -60,7 +60,8 @@ def _parse_parent_field(update_json, all_json, individual, parent_key, parent_id
         update_json[parent_key] = updated_parent
 
 
-def update_model_from_json(model_obj, json, user, allow_unknown_keys=False, immutable_keys=None, updated_fields=None, verbose=True):
+def update_model_from_json(model_obj, json, user, allow_unknown_keys=False, immutable_keys=None, updated_fields=None, verbose=True,
+                           save_updated_fields_only=False):
     immutable_keys = (immutable_keys or []) + ['created_by', 'created_date', 'last_modified_date', 'id']
     internal_fields = model_obj._meta.internal_json_fields if hasattr(model_obj._meta, 'internal_json_fields') else []
     audit_fields = model_obj._meta.audit_fields if hasattr(model_obj._meta, 'audit_fields') else set()
@@ -88,7 +89,7 @@ def update_model_from_json(model_obj, json, user, allow_unknown_keys=False, immu
                 setattr(model_obj, '{}_last_modified_by'.format(orm_key), user)
 
     if updated_fields:
-        model_obj.save()
+        model_obj.save(update_fields=[*updated_fields, 'last_modified_date'] if save_updated_fields_only else None)
         if verbose:
             log_model_update(logger, model_obj, user, 'update', updated_fields)
     return bool(updated_fields)
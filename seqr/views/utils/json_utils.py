@@ -1,6 +1,7 @@
+import orjson
 import re
 
-from django.http import JsonResponse
+from django.http import HttpResponse
 from django.core.serializers.json import DjangoJSONEncoder
 
 
@@ -13,24 +14,23 @@ class DjangoJSONEncoderWithSets(DjangoJSONEncoder):
         return super(DjangoJSONEncoderWithSets, self).default(o)
 
 
+# Datetimes are passed through to the django encoder to keep its serialization format
+ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
 def create_json_response(obj, **kwargs):
-    """Encodes the give object into json and create a django JsonResponse object with it.
+    """Encodes the give object into json and create a django HttpResponse object with it.
 
     Args:
         obj (object): json response object
-        **kwargs: any addition args to pass to the JsonResponse constructor
+        **kwargs: any addition args to pass to the HttpResponse constructor
     Returns:
-        JsonResponse
+        HttpResponse
     """
 
-    dumps_params = {
-        'sort_keys': True,
-        'indent': 4,
-        'default': DjangoJSONEncoderWithSets().default
-    }
+    content = orjson.dumps(obj, default=DjangoJSONEncoderWithSets().default, option=ORJSON_OPTIONS)
 
-    return JsonResponse(
-        obj, json_dumps_params=dumps_params, encoder=DjangoJSONEncoderWithSets, **kwargs)
+    return HttpResponse(content, content_type='application/json', **kwargs)
 
 
 CAMEL_CASE_MAP = {}